@@ -5,22 +5,179 @@
 
 "This module contains the Signal class and exceptions related to signals."
 
-import asyncio
+from collections import OrderedDict
 from enum import Enum, IntEnum
-from bisect import insort_right
-from collections import deque, namedtuple
-from collections.abc import Iterable
-from inspect import iscoroutinefunction
-from operator import attrgetter
-from threading import Lock, RLock
-from weakref import WeakValueDictionary
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import chain, count
+from operator import length_hint
+from threading import Lock
+from weakref import ref
 
 from taillight import ANY, TaillightException
-from taillight.slot import Slot, SlotNotFoundError
+from taillight.slot import _DEAD, Slot, SlotNotFoundError, WeakSlot
 
 
-# pylint: disable=invalid-name
-_SlotType = deque
+# Snapshot keys for all slots, and for senders only matching slots listening
+# on ANY. Plain objects, as these hash faster than ANY does.
+_ALL_SLOTS = object()
+_ANY_ONLY = object()
+
+
+class _SortedSlots:
+    """A sorted sequence of slots, kept as a list of sublists.
+
+    Inserting into a single list has to shift everything after the insertion
+    point. Splitting the slots into sublists of bounded size means only one
+    short sublist is shifted, so insertion and removal stay cheap with
+    thousands of slots. Iteration is done in C via :py:func:`itertools.chain`.
+
+    Slots compare by ``(priority, uid)``, which is the sort order.
+    """
+
+    __slots__ = ("_lists", "_maxes", "_len")
+
+    _load = 1000  # Sublists are split once they reach twice this size
+
+    def __init__(self, iterable=()):
+        self._lists = []
+        self._maxes = []  # Last (largest) slot of each sublist
+        self._len = 0
+        self._fill(sorted(iterable))
+
+    def _fill(self, slots):
+        """Replace the contents with an already sorted list of slots."""
+        load = self._load
+        self._lists = [slots[i:i + load] for i in range(0, len(slots), load)]
+        self._maxes = [sublist[-1] for sublist in self._lists]
+        self._len = len(slots)
+
+    def add(self, slot):
+        """Insert a slot in sorted order."""
+        lists = self._lists
+        maxes = self._maxes
+
+        if not maxes:
+            lists.append([slot])
+            maxes.append(slot)
+            self._len = 1
+            return
+
+        pos = bisect_right(maxes, slot)
+        if pos == len(maxes):
+            # Greater than everything; the usual case, as UIDs only increase
+            pos -= 1
+            lists[pos].append(slot)
+            maxes[pos] = slot
+        else:
+            sublist = lists[pos]
+            i = bisect_right(sublist, slot)
+            sublist[i:i] = (slot,)
+
+        self._len += 1
+
+        sublist = lists[pos]
+        if len(sublist) >= 2 * self._load:
+            # Split the sublist in half
+            half = sublist[self._load:]
+            del sublist[self._load:]
+            maxes[pos] = sublist[-1]
+            lists.insert(pos + 1, half)
+            maxes.insert(pos + 1, half[-1])
+
+    def update(self, slots):
+        """Insert several slots in sorted order."""
+        slots = sorted(slots)
+        if len(slots) * 8 < self._len:
+            for slot in slots:
+                self.add(slot)
+        else:
+            # Cheaper to sort everything at once; the two sorted runs are
+            # merged in a single pass by sorted().
+            self._fill(sorted(chain(self, slots)))
+
+    def _locate(self, slot):
+        """Return the sublist index and position of a slot, or raise
+        ValueError if it isn't present."""
+        pos = bisect_left(self._maxes, slot)
+        if pos < len(self._maxes):
+            sublist = self._lists[pos]
+            i = bisect_left(sublist, slot)
+            if sublist[i] == slot:
+                return pos, i
+
+        raise ValueError("Slot not found: {}".format(repr(slot)))
+
+    def remove(self, slot):
+        """Remove a slot, raising ValueError if it isn't present."""
+        pos, i = self._locate(slot)
+        sublist = self._lists[pos]
+        del sublist[i]
+        self._len -= 1
+
+        if sublist:
+            self._maxes[pos] = sublist[-1]
+        else:
+            del self._lists[pos]
+            del self._maxes[pos]
+
+    def remove_many(self, slots, uids):
+        """Remove the given slots, which must all be present; ``uids`` is the
+        set of their UIDs."""
+        if len(slots) * 8 < self._len:
+            # Only a few to go; remove them from the end so each removal
+            # shifts as little as possible.
+            for slot in sorted(slots, reverse=True):
+                self.remove(slot)
+        else:
+            self._fill([slot for slot in self if slot.uid not in uids])
+
+    def clear(self):
+        """Remove all slots."""
+        self._lists.clear()
+        self._maxes.clear()
+        self._len = 0
+
+    def __contains__(self, slot):
+        try:
+            self._locate(slot)
+        except ValueError:
+            return False
+
+        return True
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._len
+
+        if not 0 <= index < self._len:
+            raise IndexError("slot index out of range")
+
+        for sublist in self._lists:
+            if index < len(sublist):
+                return sublist[index]
+
+            index -= len(sublist)
+
+        raise IndexError("slot index out of range")
+
+    def __iter__(self):
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self):
+        return chain.from_iterable(map(reversed, reversed(self._lists)))
+
+    def __len__(self):
+        return self._len
+
+    def __eq__(self, other):
+        if not isinstance(other, _SortedSlots):
+            return NotImplemented
+
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
 
 
 class SignalException(TaillightException):
@@ -78,7 +235,22 @@ class SignalPriority(IntEnum):
     ``prio_descend`` is in effect."""
 
 
-# pylint: disable=too-many-instance-attributes
+# pylint: disable=too-few-public-methods
+class _DeferType:
+    """The saved state of a deferred call."""
+
+    __slots__ = ("iterator", "sender", "args", "kwargs", "version")
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, iterator, sender, args, kwargs, version):
+        self.iterator = iterator
+        self.sender = sender
+        self.args = args
+        self.kwargs = kwargs
+        self.version = version  # Version of the slots the iterator came from
+
+
+# pylint: disable=too-many-instance-attributes,protected-access
 class Signal:
     """A signal is an object that keeps a list of functions for calling later
     based on events they listen for.
@@ -132,11 +304,11 @@ class Signal:
     ``prio_descend`` cannot be changed once it has been decided for a slot,
     until all strong references to the signal are freed.
 
-    However, unlike blinker, all references to functions in the slots are
-    strong. The complexity of weak references to methods, and especially
-    decorated functions, aren't considered worth it. This also allows for
-    things such as slots using ``lambda``. If such functionality is required,
-    it is easily implemented by using weakref proxies independently.
+    However, unlike blinker, references to functions in the slots are strong
+    by default. This allows for things such as slots using ``lambda``. Passing
+    ``weak=True`` to :py:meth:`~taillight.signal.Signal.add` keeps only a weak
+    reference instead (see :py:class:`~taillight.slot.WeakSlot`); such slots
+    are removed from the signal once their function is garbage collected.
 
     :ivar slots:
         The slots associated with this signal.
@@ -145,25 +317,63 @@ class Signal:
         The results of the last invocation of call/call_async.
     """
 
-    _DeferType = namedtuple("_DeferType", "iterator sender args kwargs")
+    __slots__ = ("name", "slots", "_any_slots", "_listener_index",
+                 "_uid_index", "_fn_index", "_snapshots", "_has_dead_slots",
+                 "_slots_lock", "_version", "_uid_counter", "_defer",
+                 "last_status", "prio_descend", "__weakref__")
+
+    _DeferType = _DeferType
 
     _sigcreate_lock = Lock()  # Locking for the below dict
-    _signals = WeakValueDictionary()
-    _siginit_lock = Lock()  # Locking for calls to __init__
+    _signals = {}  # Name to a weak reference to the signal
+    _dead_signals = []  # Names of signals that have been collected
 
-    # pylint: disable=unused-argument
     def __new__(cls, name=None, prio_descend=True):
         if name is None:
-            return super().__new__(cls)
-
-        with Signal._sigcreate_lock:
-            signal = cls._signals.get(name, super().__new__(cls))
+            signal = super().__new__(cls)
+            signal._initialise(name, prio_descend)
+            return signal
 
-            # This doesn't really hurt if we do it twice.
-            cls._signals[name] = signal
+        # Signals are fully set up before being stored, so an existing one
+        # can be returned without taking the lock.
+        signal_ref = cls._signals.get(name)
+        if signal_ref is not None:
+            signal = signal_ref()
+            if signal is not None:
+                return signal
+
+        with cls._sigcreate_lock:
+            # Check again, in case another thread created it meanwhile
+            signal_ref = cls._signals.get(name)
+            signal = signal_ref() if signal_ref is not None else None
+            if signal is None:
+                cls._purge_dead_signals()
+
+                # Initialise here, under the lock, so a shared signal is only
+                # ever set up once; __init__ has nothing left to do.
+                signal = super().__new__(cls)
+                signal._initialise(name, prio_descend)
+
+                dead_signals = cls._dead_signals
+                cls._signals[name] = ref(
+                    signal, lambda _, name=name: dead_signals.append(name))
 
             return signal
 
+    @classmethod
+    def _purge_dead_signals(cls):
+        """Remove the entries of collected signals from the signal table.
+
+        This is done lazily, under the creation lock, rather than from the
+        weak reference callback, which may run at any time in any thread.
+        """
+        while cls._dead_signals:
+            name = cls._dead_signals.pop()
+            signal_ref = cls._signals.get(name)
+            if signal_ref is not None and signal_ref() is None:
+                del cls._signals[name]
+
+    # pylint: disable=unused-argument
     def __init__(self, name=None, prio_descend=True):
         """Create the Signal object.
 
@@ -177,21 +387,42 @@ class Signal:
             setting prio_descend to ``False``.
 
         """
-        with Signal._siginit_lock:
-            # __new__ will result in the __init__ method being called, so
-            # ensure we're not completely reset.
-            if not hasattr(self, "slots"):
-                self.slots = _SlotType()
+        # Everything is done once in __new__, so that looking up an existing
+        # shared signal doesn't reset it.
 
+    def _initialise(self, name, prio_descend):
+        """Set up a newly created signal."""
         if name is None:
             name = "<anonymous>"
 
         self.name = name
 
-        self._slots_lock = RLock()  # The GIL shouldn't be relied on!
+        self.slots = _SortedSlots()
+
+        # Slots listening on ANY, and slots with a specific listener keyed by
+        # that listener.
+        self._any_slots = _SortedSlots()
+        self._listener_index = {}
+
+        self._uid_index = {}  # UID to slot
+        # ID of the function to its slots, keyed by UID in the order added
+        self._fn_index = {}
+
+        # Cached tuples of the slots to call and their functions, see _snapshot
+        self._snapshots = {}
+
+        # Set when the function of a weak slot is collected
+        self._has_dead_slots = False
+
+        # The GIL shouldn't be relied on! This lock is never held while slots
+        # run, so it needn't be reentrant.
+        self._slots_lock = Lock()
+
+        # Bumped whenever the slots change
+        self._version = 0
 
-        self._uid = 0
-        self._uid_lock = Lock()
+        # next() on a count is atomic, so no lock is needed
+        self._uid_counter = count()
 
         self._defer = None  # Used in deferral
         self.last_status = None  # Last status of call()
@@ -208,16 +439,20 @@ class Signal:
             Boost the priority by this amount.
 
         """
-        if not args:
-            args = self.slots
-
-        attr = attrgetter("priority")
+        slots = self.slots
         if self.prio_descend:
             # Lower numbers = higher priority
-            return attr(min(args, key=attr)) - boost
+            if not args and slots:
+                # slots is sorted by priority, so the first one is the highest
+                return slots[0].priority - boost
+
+            return min(slot.priority for slot in args) - boost
 
         # Higher numbers = higher priority
-        return attr(max(args, key=attr)) + boost
+        if not args and slots:
+            return slots[-1].priority + boost
+
+        return max(slot.priority for slot in args) + boost
 
     def priority_lower(self, *args, boost=1):
         """Return a priority value below the slots specified in the
@@ -229,16 +464,20 @@ class Signal:
             Boost the priority by this amount.
 
         """
-        if not args:
-            args = self.slots
-
-        attr = attrgetter("priority")
+        slots = self.slots
         if self.prio_descend:
             # Higher numbers = lower priority
-            return attr(max(args, key=attr)) + boost
+            if not args and slots:
+                # slots is sorted by priority, so the last one is the lowest
+                return slots[-1].priority + boost
+
+            return max(slot.priority for slot in args) + boost
 
         # Lower numbers = lower priority
-        return attr(min(args, key=attr)) - boost
+        if not args and slots:
+            return slots[0].priority - boost
+
+        return min(slot.priority for slot in args) - boost
 
     def find_function(self, function):
         """Find the given :py:class:`~taillight.slot.Slot` instance(s), given
@@ -250,18 +489,38 @@ class Signal:
         If a slot with the given function is not found, then a
         :py:class:`~taillight.slot.SlotNotFoundError` is raised.
         """
-        ret = []
-        with self._slots_lock:
-            for slot in self.slots:
-                if slot.function is function:
-                    ret.append(slot)
-
+        ret = sorted(self.iter_function(function))
         if ret:
             return ret
 
         raise SlotNotFoundError("Function not found: {}".format(
             repr(function)))
 
+    def iter_function(self, function):
+        """Iterate over the :py:class:`~taillight.slot.Slot` instances with
+        the given function, in the order they were added.
+
+        This iterates over a copy of that function's slots, taken when
+        iteration starts. Unlike
+        :py:meth:`~taillight.signal.Signal.find_function`, the slots aren't
+        sorted and nothing is raised if there are none, so this is cheaper
+        for checking whether a function is in the signal.
+        """
+        with self._slots_lock:
+            slots = self._function_slots(function)
+
+        yield from slots
+
+    def _function_slots(self, function):
+        """Return a list of the slots with the given function.
+
+        The caller must hold the slots lock.
+        """
+        # Check identity too, as the ID of a collected function in a weak
+        # slot may have been reused.
+        return [slot for slot in self._fn_index.get(id(function), {}).values()
+                if slot.function is function]
+
     def find_uid(self, uid):
         """Find the given :py:class:`~taillight.slot.Slot` instance(s), given
         a uid.
@@ -272,13 +531,18 @@ class Signal:
         If a slot with the given UID is not found, then a
         :py:class:`~taillight.slot.SlotNotFoundError` is raised.
         """
-        with self._slots_lock:
-            for slot in self.slots:
-                if slot.uid == uid:
-                    return slot
+        try:
+            return self._uid_index[uid]
+        except KeyError:
+            pass
 
         raise SlotNotFoundError("Signal UID not found: {}".format(uid))
 
+    def find_uid_or_none(self, uid):
+        """Like :py:meth:`~taillight.signal.Signal.find_uid`, but returns
+        ``None`` if the slot is not found, instead of raising."""
+        return self._uid_index.get(uid)
+
     def find_listener(self, listener):
         """Find the given :py:class:`~taillight.slot.Slot` instance(s) that
         are listening on the given listener.
@@ -288,11 +552,15 @@ class Signal:
         If a slot with the given function is not found, then a
         :py:class:`~taillight.slot.SlotNotFoundError` is raised.
         """
-        ret = []
         with self._slots_lock:
-            for slot in self.slots:
-                if slot.listener is listener:
-                    ret.append(slot)
+            if listener is ANY:
+                ret = list(self._any_slots)
+            else:
+                try:
+                    ret = list(self._listener_index.get(listener, ()))
+                except TypeError:
+                    # Unhashable, so can't be a listener
+                    ret = None
 
         if ret:
             return ret
@@ -303,8 +571,9 @@ class Signal:
     def __contains__(self, slot):
         return slot in self.slots
 
+    # pylint: disable=too-many-arguments
     def add(self, function=None, priority=SignalPriority.PRIORITY_NORMAL,
-            listener=ANY):
+            listener=ANY, weak=False):
         """Add a given slot function to the signal with a given priority.
 
         :param function:
@@ -317,19 +586,27 @@ class Signal:
         :param listener:
             The sender this slot listens for. This must be a hashable object.
 
+        :param weak:
+            Only keep a weak reference to the function. The slot is removed
+            once the function (or the object a method is bound to) is garbage
+            collected. This requires ``function``; a decorated function
+            would be collected straight away, as the slot is returned in its
+            place.
+
         :returns:
             A :py:class:`~taillight.slot.Slot` object that can be used to
             delete the slot later.
 
         """
         if function is None:
-            return self.add_wraps(priority, listener)
+            if weak:
+                raise ValueError("Weak slots cannot be added as a decorator")
 
-        with self._uid_lock:
-            uid = self._uid
-            self._uid += 1
+            return self.add_wraps(priority, listener)
 
-        slot = Slot(self, priority, uid, function, listener)
+        uid = next(self._uid_counter)
+        slot_type = WeakSlot if weak else Slot
+        slot = slot_type(self, priority, uid, function, listener)
 
         with self._slots_lock:
             if self._defer is not None:
@@ -337,10 +614,124 @@ class Signal:
                 raise SignalDeferralSetError("Cannot add due to deferral "
                                              "point being set")
 
-            insort_right(self.slots, slot)
+            self.slots.add(slot)
+            self._uid_index[uid] = slot
+            bucket = self._fn_index.get(slot._function_id)
+            if bucket is None:
+                bucket = self._fn_index[slot._function_id] = OrderedDict()
+
+            bucket[uid] = slot
+            self._slots_changed()
+
+            if listener is ANY:
+                self._any_slots.add(slot)
+            else:
+                bucket = self._listener_index.get(listener)
+                if bucket is None:
+                    bucket = self._listener_index[listener] = _SortedSlots()
+
+                bucket.add(slot)
 
         return slot
 
+    def add_many(self, entries, weak=False):
+        """Add several slot functions to the signal at once.
+
+        This is cheaper than calling :py:meth:`~taillight.signal.Signal.add`
+        for each one, as the lock is only taken once and the new slots are
+        merged in together.
+
+        :param entries:
+            An iterable of ``(function, priority, listener)`` tuples, with the
+            same meaning as the arguments to
+            :py:meth:`~taillight.signal.Signal.add`.
+
+        :param weak:
+            Only keep weak references to the functions.
+
+        :returns:
+            A list of the new :py:class:`~taillight.slot.Slot` objects, in the
+            same order as ``entries``.
+        """
+        slot_type = WeakSlot if weak else Slot
+        slots = [slot_type(self, priority, next(self._uid_counter), function,
+                           listener)
+                 for function, priority, listener in entries]
+        if not slots:
+            return slots
+
+        any_slots = []
+        listeners = {}
+        for slot in slots:
+            if slot.listener is ANY:
+                any_slots.append(slot)
+            else:
+                listeners.setdefault(slot.listener, []).append(slot)
+
+        with self._slots_lock:
+            if self._defer is not None:
+                # Requires lock to avoid racing with call
+                raise SignalDeferralSetError("Cannot add due to deferral "
+                                             "point being set")
+
+            self.slots.update(slots)
+            self._any_slots.update(any_slots)
+            for listener, added in listeners.items():
+                bucket = self._listener_index.get(listener)
+                if bucket is None:
+                    bucket = self._listener_index[listener] = _SortedSlots()
+
+                bucket.update(added)
+
+            for slot in slots:
+                self._uid_index[slot.uid] = slot
+                bucket = self._fn_index.get(slot._function_id)
+                if bucket is None:
+                    bucket = self._fn_index[slot._function_id] = OrderedDict()
+
+                bucket[slot.uid] = slot
+
+            self._slots_changed()
+
+        return slots
+
+    def _slots_changed(self):
+        """Invalidate the cached snapshots after the slots change.
+
+        The caller must hold the slots lock.
+        """
+        # Clear first: call() reads the version and then the cache without
+        # the lock, so it may pair an old version with a new snapshot (which
+        # only costs a needless recheck on resume), but never the reverse.
+        self._snapshots.clear()
+        self._version += 1
+
+    def _remove_slot(self, slot):
+        """Remove a slot from all the slot lists.
+
+        The caller must hold the slots lock.
+        """
+        # Check the index first; a slot from another signal may compare equal
+        if self._uid_index.get(slot.uid) is not slot:
+            raise ValueError("Slot not in signal: {}".format(repr(slot)))
+
+        del self._uid_index[slot.uid]
+        self.slots.remove(slot)
+        self._slots_changed()
+
+        bucket = self._fn_index[slot._function_id]
+        del bucket[slot.uid]
+        if not bucket:
+            del self._fn_index[slot._function_id]
+
+        if slot.listener is ANY:
+            self._any_slots.remove(slot)
+        else:
+            bucket = self._listener_index[slot.listener]
+            bucket.remove(slot)
+            if not bucket:
+                del self._listener_index[slot.listener]
+
     def add_wraps(self, priority=SignalPriority.PRIORITY_NORMAL, listener=ANY):
         """Similar to :py:meth:`~taillight.signal.Signal.add`, but
         is for use as a decorator.
@@ -377,17 +768,79 @@ class Signal:
                                              "point being set")
 
             if isinstance(target, Slot):
-                self.slots.remove(target)
-            elif isinstance(target, Iterable):
-                for slot in target:
+                self._remove_slot(target)
+            else:
+                # Probing with iter() is cheaper than an isinstance() check
+                # against the Iterable ABC.
+                try:
+                    slots = iter(target)
+                except TypeError:
+                    message = "Expected Slot or Iterable, got {}".format(
+                        type(target).__name__)
+                    raise TypeError(message) from None
+
+                slots = list(slots)
+                for slot in slots:
                     if not isinstance(slot, Slot):
                         raise TypeError("Expected Slot, got {}".format(
                             type(slot).__name__))
 
-                    self.delete(slot)
+                self._remove_slots(slots)
+
+    def _remove_slots(self, slots):
+        """Remove several slots from all the slot lists in one pass.
+
+        Nothing is removed unless all the slots are in the signal. The caller
+        must hold the slots lock.
+        """
+        uids = set()
+        for slot in slots:
+            if self._uid_index.get(slot.uid) is not slot:
+                raise ValueError("Slot not in signal: {}".format(repr(slot)))
+
+            uids.add(slot.uid)
+
+        if not uids:
+            return
+
+        self._slots_changed()
+
+        # Drop duplicates, and work out which buckets are affected
+        slots = [self._uid_index.pop(uid) for uid in uids]
+        self.slots.remove_many(slots, uids)
+
+        listeners = {}
+        any_slots = []
+        for slot in slots:
+            if slot.listener is ANY:
+                any_slots.append(slot)
             else:
-                raise TypeError("Expected Slot or Iterable, got {}".format(
-                    type(target).__name__))
+                listeners.setdefault(slot.listener, []).append(slot)
+
+        if any_slots:
+            self._any_slots.remove_many(any_slots, uids)
+
+        for slot in slots:
+            bucket = self._fn_index[slot._function_id]
+            del bucket[slot.uid]
+            if not bucket:
+                del self._fn_index[slot._function_id]
+
+        for listener, removed in listeners.items():
+            bucket = self._listener_index[listener]
+            bucket.remove_many(removed, uids)
+            if not bucket:
+                del self._listener_index[listener]
+
+    def _prune_dead_slots(self):
+        """Remove weak slots whose function has been collected.
+
+        The caller must hold the slots lock.
+        """
+        # Clear first, so a slot dying while we scan isn't missed
+        self._has_dead_slots = False
+        self._remove_slots([slot for slot in self.slots
+                            if slot.function is None])
 
     def delete_function(self, function):
         """Delete a function from the signal.
@@ -399,7 +852,18 @@ class Signal:
 
         """
         with self._slots_lock:
-            self.delete(self.find_function(function))
+            if self._defer is not None:
+                # Requires lock to avoid racing with call
+                raise SignalDeferralSetError("Cannot delete due to deferral "
+                                             "point being set")
+
+            slots = self._function_slots(function)
+            if slots:
+                self._remove_slots(slots)
+                return
+
+        raise SlotNotFoundError("Function not found: {}".format(
+            repr(function)))
 
     def delete_uid(self, uid):
         """Delete the slot with the given UID from the signal.
@@ -414,10 +878,10 @@ class Signal:
                 raise SignalDeferralSetError("Cannot delete due to deferral "
                                              "point being set")
 
-            for i, slot in enumerate(self.slots):
-                if uid == slot.uid:
-                    del self.slots[i]
-                    return
+            slot = self._uid_index.get(uid)
+            if slot is not None:
+                self._remove_slot(slot)
+                return
 
         raise SlotNotFoundError("Signal UID not found: {}".format(uid))
 
@@ -425,6 +889,11 @@ class Signal:
         """Clear the slot of all signals."""
         with self._slots_lock:
             self.slots.clear()
+            self._any_slots.clear()
+            self._listener_index.clear()
+            self._uid_index.clear()
+            self._fn_index.clear()
+            self._slots_changed()
 
     def reset_defer(self):
         """Reset the deferred status of the signal, causing the deferred point
@@ -454,9 +923,8 @@ class Signal:
             A list of return values from the callbacks.
 
         """
-        with self._slots_lock:
-            self.reset_defer()
-            return self.call(sender, *args, **kwargs)
+        return self._dispatch(*self._prepare_call(sender, args, kwargs,
+                                                  reset=True))
 
     def yield_slots(self, sender):
         """Yield slots from the slots list.
@@ -467,12 +935,87 @@ class Signal:
         :param sender:
             The sender on this call.
         """
+        yield from self._snapshot(sender)[0]
+
+    def _snapshot_key(self, sender):
+        """Return the key the snapshot for the given sender is cached under."""
+        if sender is ANY or not self._listener_index:
+            return _ALL_SLOTS
+
+        try:
+            if sender in self._listener_index:
+                return sender
+        except TypeError:
+            # Unhashable senders can't match any listener
+            pass
+
+        return _ANY_ONLY
+
+    def _snapshot(self, sender):
+        """Return a tuple of the slots to call for the given sender, in call
+        order, and a matching tuple of the functions to call for them.
+
+        Snapshots are cached until the slots change, so repeated calls don't
+        need the lock at all.
+        """
+        if not self._has_dead_slots:
+            try:
+                return self._snapshots[self._snapshot_key(sender)]
+            except KeyError:
+                pass
+
         with self._slots_lock:
-            # Use reverse iterator if prio_descend is False (ascending order)
-            slots = self.slots if self.prio_descend else reversed(self.slots)
-            for slot in slots:
-                if slot.listener is ANY or sender == slot.listener:
-                    yield slot
+            return self._build_snapshot(sender)
+
+    def _build_snapshot(self, sender):
+        """Return the snapshot for the given sender, building and caching it
+        if needed.
+
+        The caller must hold the slots lock.
+        """
+        if not self._has_dead_slots:
+            try:
+                return self._snapshots[self._snapshot_key(sender)]
+            except KeyError:
+                pass
+
+        slots = tuple(self._matching_slots(sender))
+        snapshot = (slots, tuple(slot._fast for slot in slots))
+
+        # The key must be worked out after pruning, to match the slots
+        self._snapshots[self._snapshot_key(sender)] = snapshot
+        return snapshot
+
+    def _matching_slots(self, sender):
+        """Return an iterable of the slots to call for the given sender, in
+        call order.
+
+        The caller must hold the slots lock.
+        """
+        if self._has_dead_slots and self._defer is None:
+            self._prune_dead_slots()
+
+        if sender is ANY or not self._listener_index:
+            # Every slot matches; the common case, with no filtering at all.
+            slots = self.slots
+        else:
+            try:
+                listening = self._listener_index.get(sender)
+            except TypeError:
+                # Unhashable senders can't match any listener
+                listening = None
+
+            if listening:
+                if self.prio_descend:
+                    return merge(self._any_slots, listening)
+
+                return merge(reversed(self._any_slots), reversed(listening),
+                             reverse=True)
+
+            slots = self._any_slots
+
+        # Slots are sorted lowest priority value first
+        return slots if self.prio_descend else reversed(slots)
 
     def defer_set_args(self, args=None, kwargs=None):
         """Set the arguments when the signal is deferred. If both arguments
@@ -481,25 +1024,27 @@ class Signal:
         This function should only be directly used if you need to manually
         unset the arguments before resuming a deferred call.
         """
+        with self._slots_lock:
+            self._set_defer_args(args, kwargs)
+
+    def _set_defer_args(self, args, kwargs):
+        """Set the arguments of the deferred call, if any.
+
+        The caller must hold the slots lock.
+        """
+        if self._defer is None:
+            return
+
         if args is None and kwargs is None:
             # Unset args
             args = ()
             kwargs = {}
 
-        with self._slots_lock:
-            if self._defer is None:
-                return
-
-            if args is None:
-                args = self._defer.args
+        if args is not None:
+            self._defer.args = args
 
-            if kwargs is None:
-                kwargs = self._defer.kwargs
-
-            iterator = self._defer.iterator
-            sender = self._defer.sender
-
-            self._defer = self._DeferType(iterator, sender, args, kwargs)
+        if kwargs is not None:
+            self._defer.kwargs = kwargs
 
     # pylint: disable=inconsistent-return-statements
     def resume(self, sender):
@@ -517,11 +1062,11 @@ class Signal:
             :py:meth:`~taillight.signal.Signal.resume_async` instead.
 
         """
-        with self._slots_lock:
-            if self._defer is None:
-                return
+        call = self._prepare_call(sender, (), {}, resume=True)
+        if call is None:
+            return
 
-            return self.call(sender)
+        return self._dispatch(*call)
 
     def call(self, sender, *args, **kwargs):
         """Call the signal's slots.
@@ -545,42 +1090,155 @@ class Signal:
             A list of return values from the callbacks.
 
         """
+        if self._defer is not None:
+            return self._dispatch(*self._prepare_call(sender, args, kwargs))
+
+        # Snapshots are immutable, so no lock is needed. The version must be
+        # read first; if the slots change in between, a deferral will just
+        # recheck them needlessly on resume.
+        version = self._version
+        slots, functions = self._snapshot(sender)
+        if kwargs:
+            return self._dispatch(iter(slots), sender, args, kwargs, version,
+                                  None)
+
+        # Fast path for the usual case of nothing to resume, running just the
+        # functions without looking at the slots.
         ret = []
-
+        append = ret.append
+        calls = iter(functions)
         self.last_status = SignalStatus.STATUS_DONE
+        try:
+            if args:
+                for function in calls:
+                    s_ret = function(sender, *args)
+                    if s_ret is not _DEAD:
+                        append(s_ret)
+            else:
+                for function in calls:
+                    s_ret = function(sender)
+                    if s_ret is not _DEAD:
+                        append(s_ret)
+        except SignalStop:
+            self.last_status = SignalStatus.STATUS_STOP
+        except SignalDefer:
+            # Resume from the slot after the one that deferred
+            rest = iter(slots[len(slots) - length_hint(calls):])
+            self._set_defer(rest, sender, args, kwargs, version, None)
+
+        return ret
 
+    # pylint: disable=too-many-arguments
+    def _prepare_call(self, sender, args, kwargs, reset=False, resume=False):
+        """Work out which slots a call runs, and with which arguments.
+
+        This returns the arguments for
+        :py:meth:`~taillight.signal.Signal._dispatch`, or None if ``resume``
+        is set and the signal is not deferred.
+        """
         with self._slots_lock:
-            if self._defer is None:
-                slots = self.yield_slots(sender)
+            if reset:
+                self._defer = None
+
+            defer = self._defer
+            if defer is None:
+                if resume:
+                    return None
+
+                return (iter(self._build_snapshot(sender)[0]), sender, args,
+                        kwargs, self._version, None)
+
+            # FIXME: allow multiple pending deferrals
+            if (sender is not None and sender is not defer.sender
+                    and sender != defer.sender):
+                raise SignalDeferralSenderError("deferred signal sender "
+                                                "unexpectedly changed")
+
+            if args or kwargs:
+                # Reset args
+                self._set_defer_args(args, kwargs)
+
+            if defer.version != self._version:
+                # The slots changed between taking the snapshot and deferring
+                # (e.g. a slot deleted another); don't run deleted slots.
+                defer.iterator = iter([slot for slot in defer.iterator
+                                       if self._uid_index.get(slot.uid) is
+                                       slot])
+                defer.version = self._version
+
+            return (defer.iterator, sender, defer.args, defer.kwargs,
+                    defer.version, defer)
+
+    # pylint: disable=too-many-arguments
+    def _dispatch(self, slots, sender, args, kwargs, version, defer):
+        """Run the given slots, without holding the lock.
+
+        ``defer`` is the deferral point being resumed, if any.
+        """
+        ret = []
+        append = ret.append
+
+        self.last_status = SignalStatus.STATUS_DONE
+
+        # Work out how to pass the arguments once, rather than per slot;
+        # calling with no *args/**kwargs to unpack is much cheaper. Weak slots
+        # whose function has died return _DEAD, and are skipped.
+        try:
+            if kwargs:
+                for slot in slots:
+                    s_ret = slot._fast(sender, *args, **kwargs)
+                    if s_ret is not _DEAD:
+                        append(s_ret)
+            elif args:
+                for slot in slots:
+                    s_ret = slot._fast(sender, *args)
+                    if s_ret is not _DEAD:
+                        append(s_ret)
             else:
-                if sender is not None and sender != self._defer.sender:
-                    raise SignalDeferralSenderError("deferred signal sender "
-                                                    "unexpectedly changed")
+                for slot in slots:
+                    s_ret = slot._fast(sender)
+                    if s_ret is not _DEAD:
+                        append(s_ret)
+        except SignalStop:
+            self.last_status = SignalStatus.STATUS_STOP
+        except SignalDefer:
+            self._set_defer(slots, sender, args, kwargs, version, defer)
+            return ret
 
-                slots = self._defer.iterator
+        if defer is not None:
+            self._finish_defer(defer)
 
-                if args or kwargs:
-                    # Reset args
-                    self.defer_set_args(args, kwargs)
+        return ret
 
-                args = self._defer.args
-                kwargs = self._defer.kwargs
+    # pylint: disable=too-many-arguments
+    def _set_defer(self, slots, sender, args, kwargs, version, defer):
+        """Save the deferral point of a call whose slot deferred.
 
-            for slot in slots:
-                # Run the slot
-                try:
-                    ret.append(slot(sender, *args, **kwargs))
-                except SignalStop:
-                    self.last_status = SignalStatus.STATUS_STOP
-                    break
-                except SignalDefer:
-                    self.last_status = SignalStatus.STATUS_DEFER
-                    self._defer = self._DeferType(slots, sender, args, kwargs)
-                    return ret
+        ``defer`` is the deferral point the call was resuming, if any. As slots
+        run without the lock, another call may have deferred in the meantime;
+        that deferral is kept, and this raises instead of replacing it.
+        """
+        with self._slots_lock:
+            current = self._defer
+            if current is not None and current is not defer:
+                if sender is not current.sender and sender != current.sender:
+                    raise SignalDeferralSenderError("another call with a "
+                                                    "different sender has "
+                                                    "deferred")
+
+                raise SignalDeferralSetError("Cannot defer due to deferral "
+                                             "point being set")
 
-            self.reset_defer()
+            self._defer = self._DeferType(slots, sender, args, kwargs,
+                                          version)
+            self.last_status = SignalStatus.STATUS_DEFER
 
-        return ret
+    def _finish_defer(self, defer):
+        """Reset the deferral point after a call has run to completion, unless
+        another call has deferred in the meantime."""
+        with self._slots_lock:
+            if self._defer is defer:
+                self._defer = None
 
     async def call_async(self, sender, *args, **kwargs):
         """Call the signal's slots asynchronously.
@@ -604,50 +1262,54 @@ class Signal:
         :returns:
             A list of return values from the callbacks.
         """
-
+        # Never hold the lock across an await; run from a snapshot instead.
+        if self._defer is None:
+            version = self._version
+            return await self._dispatch_async(iter(self._snapshot(sender)[0]),
+                                              sender, args, kwargs, version,
+                                              None)
+
+        return await self._dispatch_async(*self._prepare_call(sender, args,
+                                                              kwargs))
+
+    # pylint: disable=too-many-arguments
+    async def _dispatch_async(self, slots, sender, args, kwargs, version,
+                              defer):
+        """Run the given slots asynchronously, without holding the lock.
+
+        ``defer`` is the deferral point being resumed, if any.
+        """
         ret = []
-        slot_args = args
-        slot_kwargs = kwargs
 
         self.last_status = SignalStatus.STATUS_DONE
 
-        with self._slots_lock:
-            if self._defer is None:
-                slots = self.yield_slots(sender)
-            else:
-                # FIXME: allow multiple pending deferrals
-                if sender is not None and sender != self._defer.sender:
-                    raise SignalDeferralSenderError("deferred signal "
-                                                    "sender unexpectedly "
-                                                    "changed")
-
-                slots = self._defer.iterator
-
-                if args or kwargs:
-                    # Reset args
-                    self.defer_set_args(args, kwargs)
-
-                slot_args = self._defer.args
-                slot_kwargs = self._defer.kwargs
+        plain = not args and not kwargs
+        append = ret.append
 
+        try:
             for slot in slots:
-                # Run the slot
-                try:
-                    s_ret = slot(sender, *slot_args, **slot_kwargs)
-                    if iscoroutinefunction(slot.function):
-                        s_ret = await s_ret
-
-                    ret.append(s_ret)
-                except SignalStop:
-                    self.last_status = SignalStatus.STATUS_STOP
-                    break
-                except SignalDefer:
-                    self.last_status = SignalStatus.STATUS_DEFER
-                    self._defer = self._DeferType(slots, sender, args,
-                                                  kwargs)
-                    return ret
-
-            self.reset_defer()
+                if plain:
+                    s_ret = slot._fast(sender)
+                elif kwargs:
+                    s_ret = slot._fast(sender, *args, **kwargs)
+                else:
+                    s_ret = slot._fast(sender, *args)
+                if s_ret is _DEAD:
+                    # A weak slot whose function has died
+                    continue
+
+                if slot._is_coro:
+                    s_ret = await s_ret
+
+                append(s_ret)
+        except SignalStop:
+            self.last_status = SignalStatus.STATUS_STOP
+        except SignalDefer:
+            self._set_defer(slots, sender, args, kwargs, version, defer)
+            return ret
+
+        if defer is not None:
+            self._finish_defer(defer)
 
         return ret
 
@@ -663,12 +1325,11 @@ class Signal:
         includes checking if the signal is deferred. Otherwise, it shares
         all the semantics of ``call_async``.
         """
-        with self._slots_lock:
-            if self._defer is None:
-                return
+        call = self._prepare_call(sender, (), {}, resume=True)
+        if call is None:
+            return
 
-            ret = await self.call_async(sender)
-            return ret
+        return await self._dispatch_async(*call)
 
     def __len__(self):
         return len(self.slots)
@@ -687,10 +1348,18 @@ class StrongSignal(Signal):
     :py:class:`~taillight.signal.StrongSignal.delete_signal`.
     """
 
+    __slots__ = ()
+
     # Use separate locks than above...
-    _sigcreate_lock = Lock()  # Locking for the below dict
-    _signals = dict()
-    _siginit_lock = Lock()  # Locking for calls to __init__
+    _sigcreate_lock = Lock()  # Locking for the below dicts
+    _signals = {}
+    _dead_signals = []
+    _strong_signals = {}  # Keeps the signals above alive
+
+    def _initialise(self, name, prio_descend):
+        super()._initialise(name, prio_descend)
+        if name is not None:
+            self._strong_signals[name] = self
 
     @classmethod
     def delete_signal(cls, signal):
@@ -710,10 +1379,14 @@ class StrongSignal(Signal):
         :param signal:
             Name of the signal to remove.
         """
-        try:
+        with cls._sigcreate_lock:
+            try:
+                del cls._strong_signals[signal]
+            except KeyError:
+                raise SignalNotFoundError("Signal not found: {}".format(
+                    signal)) from None
+
             del cls._signals[signal]
-        except ValueError:
-            raise SignalNotFoundError("Signal not found: {}".format(signal))
 
     def __repr__(self):
         return "StrongSignal(name={}, prio_descend={}, slots={})".format(
@@ -728,10 +1401,12 @@ class UnsharedSignal(Signal):
     with a name.
     """
 
-    # We can use the default implementation
-    # pylint: disable=arguments-differ,unused-argument
-    def __new__(cls, *args, **kwargs):
-        return object.__new__(cls)
+    __slots__ = ()
+
+    def __new__(cls, name=None, prio_descend=True):
+        signal = object.__new__(cls)
+        signal._initialise(name, prio_descend)
+        return signal
 
     def __repr__(self):
         return "UnsharedSignal(name={}, prio_descend={}, slots={})".format(
@@ -6,7 +6,9 @@
 """This module contains the Slot class and slot-related exceptions."""
 
 
-from functools import update_wrapper
+from functools import total_ordering, update_wrapper
+from inspect import iscoroutinefunction, ismethod
+from weakref import WeakMethod, ref
 
 from taillight import TaillightException
 
@@ -19,6 +21,7 @@ class SlotNotFoundError(SlotError):
     """Raised when a given slot is not found."""
 
 
+@total_ordering
 class Slot:
     """A slot in a given signal.
 
@@ -29,6 +32,14 @@ class Slot:
 
     """
 
+    # What update_wrapper copies from the function is slotted too, except
+    # for __doc__ and __module__, which clash with the class attributes; they
+    # and any attributes of the function itself go in __dict__.
+    __slots__ = ("signal", "priority", "uid", "function", "listener",
+                 "_is_coro", "_function_id", "_fast", "_hash", "__name__",
+                 "__qualname__", "__annotations__", "__wrapped__", "__dict__",
+                 "__weakref__")
+
     # pylint: disable=too-many-arguments
     def __init__(self, signal, priority, uid, function, listener):
         """Initalise the Slot object.
@@ -50,39 +61,158 @@ class Slot:
             The listener this object listens on.
 
         """
+        # What the signal actually calls; going through __call__ costs an
+        # extra call and repacking the arguments for every slot run. Set
+        # before the function, as WeakSlot replaces it there.
+        self._fast = function
+
         self.signal = signal
         self.priority = priority
         self.uid = uid
         self.function = function
         self.listener = listener
 
-        update_wrapper(self, function)
+        # Checked on every call_async, so only work it out once
+        self._is_coro = iscoroutinefunction(function)
+
+        # What the signal indexes the slot under in find_function; kept
+        # separately, as a weak slot may lose its function.
+        self._function_id = id(function)
+
+        # None of these change, so the hash doesn't either
+        self._hash = hash((signal, priority, uid, self._function_id,
+                           listener))
+
+        # update_wrapper, unrolled for the usual case of a function or
+        # method, as this is done for every slot added. Plain assignments
+        # keep the instance dict key-sharing, and so much smaller.
+        try:
+            self.__module__ = function.__module__
+            self.__name__ = function.__name__
+            self.__qualname__ = function.__qualname__
+            self.__annotations__ = function.__annotations__
+            self.__doc__ = function.__doc__
+        except AttributeError:
+            # Some other callable; update_wrapper skips what it lacks
+            update_wrapper(self, function)
+        else:
+            function_dict = getattr(function, "__dict__", None)
+            if function_dict:
+                self.__dict__.update(function_dict)
+
+            self.__wrapped__ = function
 
     def __call__(self, caller, *args, **kwargs):
         return self.function(caller, *args, **kwargs)
 
     def __hash__(self):
-        return hash((self.signal, self.priority, self.uid, self.function,
-                     self.listener))
+        return self._hash
 
     def __repr__(self):
         return "Slot(priority={}, uid={}, function={}, listener={})".format(
             self.priority, self.uid, self.function, self.listener)
 
+    # Slots are ordered by (priority, uid); these compare the fields directly
+    # rather than building a pair of tuples for every comparison. Sorting and
+    # bisection only use __lt__, so total_ordering fills in the rest.
+
     def __lt__(self, other):
-        return (self.priority, self.uid) < (other.priority, other.uid)
+        if self.priority != other.priority:
+            return self.priority < other.priority
 
-    def __le__(self, other):
-        return (self.priority, self.uid) <= (other.priority, other.uid)
+        return self.uid < other.uid
 
-    def __gt__(self, other):
-        return (self.priority, self.uid) > (other.priority, other.uid)
+    def __eq__(self, other):
+        return self.priority == other.priority and self.uid == other.uid
 
-    def __ge__(self, other):
-        return (self.priority, self.uid) >= (other.priority, other.uid)
 
-    def __eq__(self, other):
-        return (self.priority, self.uid) == (other.priority, other.uid)
+# Returned by a weak slot's caller once its function has been collected, so
+# the signal can tell it apart from a slot returning None and skip it.
+_DEAD = object()
+
+
+def _weak_caller(function_ref):
+    """Return a function calling the referent of ``function_ref``, or
+    returning ``_DEAD`` if it has been collected.
+
+    This only refers to the weak reference, not the slot, so it doesn't
+    create a reference cycle.
+    """
+    def call(caller, *args, **kwargs):
+        function = function_ref()
+        if function is None:
+            return _DEAD
+
+        return function(caller, *args, **kwargs)
+
+    return call
+
+
+def _weak_expirer(signal):
+    """Return a weak reference callback flagging ``signal`` as having dead
+    slots to prune.
+
+    Like :py:func:`_weak_caller`, this doesn't refer to the slot, so the slot
+    and its weak reference don't form a cycle; nor does it keep the signal
+    alive.
+    """
+    signal_ref = ref(signal)
+
+    def expire(_):
+        # Called from the garbage collector, so only set a flag for the
+        # signal to prune the slot later.
+        signal = signal_ref()
+        if signal is not None:
+            signal._has_dead_slots = True  # pylint: disable=protected-access
+
+    return expire
+
 
-    def __ne__(self, other):
-        return (self.priority, self.uid) != (other.priority, other.uid)
+class WeakSlot(Slot):
+    """A slot that only keeps a weak reference to its function.
+
+    Once the function (or, for a bound method, the object it is bound to) has
+    been garbage collected, :py:attr:`function` is ``None``, calling the slot
+    does nothing, and the signal removes the slot the next time it is called.
+
+    These are created by :py:meth:`~taillight.signal.Signal.add` with
+    ``weak=True``.
+
+    """
+
+    __slots__ = ("_ref",)
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, signal, priority, uid, function, listener):
+        super().__init__(signal, priority, uid, function, listener)
+
+        # update_wrapper keeps a strong reference here
+        del self.__wrapped__
+
+    @property
+    def function(self):
+        """The function called when the signal is run, or ``None`` if it has
+        been garbage collected."""
+        return self._ref()
+
+    @function.setter
+    def function(self, function):
+        expire = _weak_expirer(self.signal)
+        if ismethod(function):
+            self._ref = WeakMethod(function, expire)
+        else:
+            self._ref = ref(function, expire)
+
+        self._fast = _weak_caller(self._ref)
+
+    def __call__(self, caller, *args, **kwargs):
+        function = self.function
+        if function is None:
+            return None
+
+        return function(caller, *args, **kwargs)
+
+    def __repr__(self):
+        return ("WeakSlot(priority={}, uid={}, function={}, "
+                "listener={})".format(self.priority, self.uid, self.function,
+                                      self.listener))
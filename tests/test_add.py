@@ -1,5 +1,9 @@
+import functools
+import gc
 import unittest
+import weakref
 from taillight import signal
+from taillight.slot import WeakSlot
 
 
 class TestAddSlot(unittest.TestCase):
@@ -15,8 +19,8 @@ class TestAddSlot(unittest.TestCase):
         slot2 = self.signal.add(function2)
 
         self.assertSequenceEqual(self.signal.slots,
-                                 signal._SlotType((slot1, slot2)),
-                                 signal._SlotType)
+                                 signal._SortedSlots((slot1, slot2)),
+                                 signal._SortedSlots)
 
     def test_add_decorate(self):
         function1 = lambda x: None
@@ -27,8 +31,132 @@ class TestAddSlot(unittest.TestCase):
         slot2 = self.signal.add_wraps()(function2)
 
         self.assertSequenceEqual(self.signal.slots,
-                                 signal._SlotType((slot1, slot2)),
-                                 signal._SlotType)
+                                 signal._SortedSlots((slot1, slot2)),
+                                 signal._SortedSlots)
+
+    def test_add_wrapper(self):
+        def function(sender):
+            """Docstring."""
+
+        function.attribute = True
+
+        slot = self.signal.add(function)
+        self.assertEqual(slot.__name__, "function")
+        self.assertEqual(slot.__doc__, "Docstring.")
+        self.assertTrue(slot.attribute)
+        self.assertIs(slot.__wrapped__, function)
+
+        # Callables without the usual function attributes still work
+        slot = self.signal.add(functools.partial(function))
+        self.assertIsInstance(slot.__wrapped__, functools.partial)
+
+    def test_add_split(self):
+        # Force the sorted slot list to split into several sublists
+        self.addCleanup(setattr, signal._SortedSlots, "_load",
+                        signal._SortedSlots._load)
+        signal._SortedSlots._load = 2
+
+        slots = [self.signal.add(lambda x: None, priority=i % 3)
+                 for i in range(20)]
+        slots.sort(key=lambda slot: (slot.priority, slot.uid))
+
+        self.assertListEqual(list(self.signal.slots), slots)
+        self.assertListEqual(list(self.signal.yield_slots(signal.ANY)),
+                             slots)
+
+        self.signal.delete(slots[5])
+        del slots[5]
+        self.assertListEqual(list(self.signal.slots), slots)
+
+    def test_add_many(self):
+        self.signal.add(lambda x: "first", priority=1)
+        slots = self.signal.add_many([(lambda x: 0, 2, signal.ANY),
+                                      (lambda x: 1, 0, "x"),
+                                      (lambda x: 2, 1, "y")])
+
+        self.assertListEqual([slot.priority for slot in slots], [2, 0, 1])
+        self.assertIs(self.signal.find_uid(slots[1].uid), slots[1])
+        self.assertListEqual(self.signal.find_listener("x"), [slots[1]])
+        self.assertListEqual(self.signal.call("x"), [1, "first", 0])
+        self.assertListEqual(self.signal.call(signal.ANY),
+                             [1, "first", 2, 0])
+        self.assertListEqual(self.signal.add_many([]), [])
+
+    def test_add_weak(self):
+        class Receiver:
+            def method(self, sender):
+                return "called"
+
+        receiver = Receiver()
+        function = lambda x: "strong"
+
+        slot1 = self.signal.add(receiver.method, weak=True)
+        slot2 = self.signal.add(function)
+        self.assertIsInstance(slot1, WeakSlot)
+        self.assertListEqual(self.signal.call(signal.ANY),
+                             ["called", "strong"])
+
+        del receiver
+        gc.collect()
+
+        self.assertIsNone(slot1.function)
+        self.assertIsNone(slot1(signal.ANY))
+        self.assertListEqual(self.signal.call(signal.ANY), ["strong"])
+        self.assertNotIn(slot1, self.signal)
+        self.assertIn(slot2, self.signal)
+
+        # A slot dying while the call is deferred is skipped on resume
+        def defer(sender, *args, **kwargs):
+            raise signal.SignalDefer()
+
+        for args, kwargs in (((), {}), ((1,), {}), ((), {"arg": 1})):
+            receiver = Receiver()
+            self.signal.clear()
+            self.signal.add(defer, priority=0)
+            self.signal.add(lambda sender, *args, **kwargs: None, priority=1,
+                            weak=True)
+            self.signal.add(receiver.method, priority=2, weak=True)
+
+            self.signal.call(signal.ANY, *args, **kwargs)
+            self.assertEqual(self.signal.last_status,
+                             signal.SignalStatus.STATUS_DEFER)
+
+            del receiver
+            gc.collect()
+
+            self.assertListEqual(self.signal.resume(signal.ANY), [])
+
+        # Likewise for a slot dying partway through a call
+        receivers = []
+
+        def kill(sender, *args):
+            receivers.clear()
+            gc.collect()
+
+        for args in ((), (1,)):
+            receivers.append(Receiver())
+            self.signal.clear()
+            self.signal.add(kill, priority=0)
+            self.signal.add(receivers[0].method, priority=1, weak=True)
+            self.assertListEqual(self.signal.call(signal.ANY, *args), [None])
+
+    def test_add_weak_no_cycle(self):
+        gc.disable()
+        self.addCleanup(gc.enable)
+
+        function = lambda x: None
+        slot = self.signal.add(function, weak=True)
+        self.signal.delete(slot)
+
+        # Freed by reference counting alone, without the collector
+        slot_ref = weakref.ref(slot)
+        del slot
+        self.assertIsNone(slot_ref())
+
+    def test_add_weak_decorate(self):
+        # The decorated function would die as soon as it was added
+        with self.assertRaises(ValueError):
+            self.signal.add(weak=True)
 
 
 if __name__ == '__main__':
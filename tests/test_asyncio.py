@@ -1,3 +1,4 @@
+import gc
 import unittest
 from taillight import signal
 
@@ -80,6 +81,35 @@ class TestCallSlot(unittest.TestCase):
         self.assertEqual(y, 1)
         self.assertEqual(z, 1)
 
+    def test_weak_dead(self):
+        class Receiver:
+            async def coroutine(self, sender):
+                return "coroutine"
+
+            def method(self, sender):
+                return "method"
+
+        def defer(sender):
+            raise signal.SignalDefer()
+
+        receiver = Receiver()
+        self.signal.add(defer, priority=0)
+        slots = [self.signal.add(receiver.coroutine, priority=1, weak=True),
+                 self.signal.add(receiver.method, priority=2, weak=True)]
+
+        self.loop.run_until_complete(self.signal.call_async("x"))
+        self.assertEqual(self.signal.last_status,
+                         signal.SignalStatus.STATUS_DEFER)
+
+        del receiver
+        gc.collect()
+
+        # The dead slots are skipped rather than called or awaited
+        result = self.loop.run_until_complete(self.signal.resume_async("x"))
+        self.assertListEqual(result, [])
+        for slot in slots:
+            self.assertIsNone(slot.function)
+
 
 if __name__ == '__main__':
     unittest.main()
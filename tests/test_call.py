@@ -1,3 +1,4 @@
+import threading
 import unittest
 from taillight import signal
 
@@ -77,6 +78,79 @@ class TestCallSlot(unittest.TestCase):
         self.signal.delete(slot1)
         self.signal.delete(slot2)
 
+    def test_call_listener_order(self):
+        self.signal.add(lambda x: 0, priority=0)
+        self.signal.add(lambda x: 1, priority=1, listener="x")
+        self.signal.add(lambda x: 2, priority=2)
+        self.signal.add(lambda x: 3, priority=1, listener="y")
+
+        self.assertListEqual(self.signal.call("x"), [0, 1, 2])
+        self.assertListEqual(self.signal.call("y"), [0, 3, 2])
+        self.assertListEqual(self.signal.call("z"), [0, 2])
+        self.assertListEqual(self.signal.call(signal.ANY), [0, 1, 3, 2])
+
+    def test_call_add_during_call(self):
+        def adder(sender):
+            self.signal.add(test_func)
+
+        self.signal.add(adder)
+
+        # The slot added mid-call runs on the next call, not this one
+        self.assertListEqual(self.signal.call(signal.ANY), [None])
+        self.assertEqual(len(self.signal), 2)
+        self.assertListEqual(self.signal.call(signal.ANY), [None, 1])
+
+    def test_call_delete_before_defer(self):
+        def deleter(sender):
+            self.signal.delete(slot)
+
+        self.signal.add(deleter, priority=0)
+        self.signal.add(test_defer, priority=1)
+        slot = self.signal.add(test_func, priority=2)
+
+        self.signal.call(signal.ANY)
+        self.assertEqual(self.signal.last_status,
+                         signal.SignalStatus.STATUS_DEFER)
+
+        # The slot deleted before deferring must not run on resume
+        self.assertListEqual(self.signal.resume(signal.ANY), [])
+        self.assertEqual(x, 0)
+        self.assertIsNone(self.signal._defer)
+
+    def test_defer_concurrent(self):
+        barrier = threading.Barrier(2)
+
+        def defer(sender):
+            # Make both calls defer at once
+            barrier.wait(5)
+            raise signal.SignalDefer()
+
+        self.signal.add(defer)
+        self.signal.add(test_func)
+
+        errors = {}
+
+        def run(sender):
+            try:
+                self.signal.call(sender)
+            except signal.SignalDeferralSenderError as e:
+                errors[sender] = e
+
+        threads = [threading.Thread(target=run, args=(sender,))
+                   for sender in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Only one deferral is kept; the other call must not lose its state
+        # silently.
+        self.assertEqual(len(errors), 1)
+        deferred = ({"a", "b"} - set(errors)).pop()
+        self.assertEqual(self.signal._defer.sender, deferred)
+        self.assertListEqual(self.signal.resume(deferred), [1])
+        self.assertIsNone(self.signal._defer)
+
     def test_defer(self):
         global x, y
         slot1 = self.signal.add(test_func)
@@ -35,6 +35,63 @@ class TestDeleteSlot(unittest.TestCase):
         with self.assertRaises(SlotNotFoundError):
             self.signal.find_uid(slot2.uid)
 
+    def test_delete_many(self):
+        function = lambda x: None
+
+        slots = [self.signal.add(function, listener=listener)
+                 for listener in (signal.ANY, "x", "x", "y")]
+        keep = self.signal.add(lambda x: None, listener="x")
+
+        self.signal.delete(slots)
+        self.assertEqual(len(self.signal), 1)
+        self.assertIn(keep, self.signal)
+        self.assertListEqual(self.signal.find_listener("x"), [keep])
+
+        with self.assertRaises(SlotNotFoundError):
+            self.signal.find_function(function)
+
+        with self.assertRaises(SlotNotFoundError):
+            self.signal.find_listener("y")
+
+        # Nothing is deleted if any of the slots are missing
+        with self.assertRaises(ValueError):
+            self.signal.delete([keep, slots[0]])
+
+        self.assertIn(keep, self.signal)
+
+    def test_delete_other_signal(self):
+        slot = self.signal.add(lambda x: None)
+        other = signal.Signal().add(lambda x: None)
+
+        # Same priority and UID, but not this signal's slot
+        with self.assertRaises(ValueError):
+            self.signal.delete(other)
+
+        self.assertIn(slot, self.signal)
+        self.assertEqual(len(self.signal), 1)
+
+    def test_delete_type(self):
+        slot = self.signal.add(lambda x: None)
+
+        with self.assertRaises(TypeError):
+            self.signal.delete(5)
+
+        with self.assertRaises(TypeError):
+            self.signal.delete([slot, 5])
+
+        self.assertIn(slot, self.signal)
+
+        self.signal.delete((slot,))
+        self.assertEqual(len(self.signal), 0)
+
+    def test_delete_many_few(self):
+        slots = [self.signal.add(lambda x: None, priority=i % 7)
+                 for i in range(100)]
+
+        self.signal.delete(slots[::10])
+        self.assertListEqual(list(self.signal.slots),
+                             sorted(set(slots) - set(slots[::10])))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from taillight import signal
+from taillight.slot import SlotNotFoundError
 
 
 class TestFindFunction(unittest.TestCase):
@@ -35,6 +36,42 @@ class TestFindFunction(unittest.TestCase):
         self.assertIn(slot, result)
         self.assertIn(slot2, result)
 
+    def test_uid_or_none(self):
+        slot = self.signal.add(lambda x: None)
+
+        self.assertIs(self.signal.find_uid_or_none(slot.uid), slot)
+        self.assertIsNone(self.signal.find_uid_or_none(slot.uid + 1))
+
+    def test_iter_function(self):
+        function = lambda x: None
+        slot = self.signal.add(function)
+        self.signal.add(lambda x: None)
+        slot2 = self.signal.add(function, priority=-1)
+
+        self.assertListEqual(list(self.signal.iter_function(function)),
+                             [slot, slot2])
+        self.assertListEqual(self.signal.find_function(function),
+                             [slot2, slot])
+
+        self.assertListEqual(list(self.signal.iter_function(len)), [])
+        with self.assertRaises(SlotNotFoundError):
+            self.signal.find_function(len)
+
+    def test_listener(self):
+        function = lambda x: None
+        slot = self.signal.add(function, listener="x")
+        slot2 = self.signal.add(function)
+        slot3 = self.signal.add(function, listener="x", priority=-1)
+
+        self.assertListEqual(self.signal.find_listener("x"), [slot3, slot])
+        self.assertListEqual(self.signal.find_listener(signal.ANY), [slot2])
+
+        with self.assertRaises(SlotNotFoundError):
+            self.signal.find_listener("y")
+
+        with self.assertRaises(SlotNotFoundError):
+            self.signal.find_listener([])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,4 @@
+import gc
 import unittest
 from taillight import signal
 
@@ -29,7 +30,18 @@ class TestSignalObject(unittest.TestCase):
         signal_a2 = signal.Signal("a")
 
         self.assertSequenceEqual(signal_a_slots, signal_a2.slots,
-                                 signal._SlotType)
+                                 signal._SortedSlots)
+
+    def test_singleton_no_reinit(self):
+        signal_a = signal.Signal("noreinit", prio_descend=False)
+        slot1 = signal_a.add(lambda x: None)
+
+        # Looking the signal up again must not reset its state
+        signal_a2 = signal.Signal("noreinit")
+        slot2 = signal_a2.add(lambda x: None)
+
+        self.assertFalse(signal_a2.prio_descend)
+        self.assertNotEqual(slot1.uid, slot2.uid)
 
     def test_unshared(self):
         signal_a = signal.UnsharedSignal("a")
@@ -60,6 +72,22 @@ class TestSignalObject(unittest.TestCase):
         # Clean up
         signal_a.delete_signal("a")
 
+        with self.assertRaises(signal.SignalNotFoundError):
+            signal.StrongSignal.delete_signal("a")
+
+    def test_collected(self):
+        signal_a = signal.Signal("collected")
+        signal_a.add(lambda x: None)
+
+        # Remove last strong reference
+        del signal_a
+        gc.collect()
+
+        # A fresh signal should be created
+        signal_a = signal.Signal("collected")
+        self.assertEqual(len(signal_a), 0)
+        self.assertIs(signal.Signal("collected"), signal_a)
+
     def test_anonymous_signal(self):
         signal_anon1 = signal.Signal()
         signal_anon2 = signal.Signal()
@@ -4,9 +4,16 @@ from taillight import signal
 
 class TestPriority(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.signal_a = signal.Signal(prio_descend=False)
+        cls.signal_d = signal.Signal()
+
     def setUp(self):
-        self.signal_a = signal.Signal(prio_descend=False)
-        self.signal_d = signal.Signal()
+        self.signal_a.reset_defer()
+        self.signal_a.clear()
+        self.signal_d.reset_defer()
+        self.signal_d.clear()
 
     def test_higher_ascend(self):
         slot = self.signal_a.add(lambda x: None)
@@ -28,6 +35,16 @@ class TestPriority(unittest.TestCase):
         # Higher priority values are lower priority
         self.assertGreater(self.signal_d.priority_lower(slot), slot.priority)
 
+    def test_no_args(self):
+        for sig in (self.signal_a, self.signal_d):
+            sig.add(lambda x: None, priority=-5)
+            sig.add(lambda x: None, priority=7)
+
+        self.assertEqual(self.signal_a.priority_higher(), 8)
+        self.assertEqual(self.signal_a.priority_lower(), -6)
+        self.assertEqual(self.signal_d.priority_higher(), -6)
+        self.assertEqual(self.signal_d.priority_lower(), 8)
+
     def test_priority_call_ascend(self):
         slot1 = self.signal_a.add(lambda x: 2)
         slot2 = self.signal_a.add(lambda x: 1,